@@ -42,8 +42,9 @@ if 'total_to_process' not in st.session_state:
 @st.cache_resource
 def get_pipeline_and_scraper():
     pipeline = main.LinkedInOutreachPipeline()
-    db_ops = main.DatabaseOps()
-    linkedin_scraper = main.LinkedInScraper(pipeline.config)
+    # Reuse the pipeline's components so the app drives a single Chrome instance and database helper
+    db_ops = pipeline.db
+    linkedin_scraper = pipeline.scraper
     return pipeline, db_ops, linkedin_scraper
 
 pipeline, db_ops, linkedin_scraper = get_pipeline_and_scraper()